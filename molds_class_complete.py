@@ -1,6 +1,23 @@
+import os
+from collections import defaultdict
+
+import numpy as np
 import pandas as pd
 
+# Prefer the multithreaded Arrow CSV parser when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+# The Arrow parser costs a few ms to start, so smaller files stay on the C parser
+ARROW_MIN_BYTES = 1 << 20
+
 class Mold:
+    __slots__ = ('mold_id', 'volume', 'weight', 'heating_time', 'heating_temperature', 'cooling_time',
+                 'mounting_time', 'distance_from_center', 'available_quantity', 'mold_type',
+                 'torque', 'cycle_time', '_inv_temp', '_inv_time')
+
     def __init__(self, mold_id, volume, weight, heating_time, heating_temperature, cooling_time,
                  mounting_time, distance_from_center, available_quantity, mold_type='UNKNOWN'):
         self.mold_id = mold_id
@@ -13,19 +30,25 @@ class Mold:
         self.distance_from_center = distance_from_center
         self.available_quantity = available_quantity
         self.mold_type = mold_type
+        # Inputs are fixed for the mold's lifetime, so compute these once
+        self.torque = weight * distance_from_center
+        self.cycle_time = heating_time + cooling_time + mounting_time
+        # Reciprocals for check_compatibility_with; a zero reference is never compatible
+        self._inv_temp = 1.0 / heating_temperature if heating_temperature else float('inf')
+        self._inv_time = 1.0 / heating_time if heating_time else float('inf')
 
     def calculate_torque(self):
-        return self.weight * self.distance_from_center
+        return self.torque
 
     def get_cycle_time(self):
-        return self.heating_time + self.cooling_time + self.mounting_time
+        return self.cycle_time
 
     def check_availability(self, required_quantity):
         return required_quantity <= self.available_quantity
 
     def check_compatibility_with(self, other_mold, temp_tolerance=0.02, time_tolerance=0.02):
-        temp_diff = abs(self.heating_temperature - other_mold.heating_temperature) / self.heating_temperature
-        time_diff = abs(self.heating_time - other_mold.heating_time) / self.heating_time
+        temp_diff = abs(self.heating_temperature - other_mold.heating_temperature) * self._inv_temp
+        time_diff = abs(self.heating_time - other_mold.heating_time) * self._inv_time
         return temp_diff <= temp_tolerance and time_diff <= time_tolerance
 
     def get_parameter_range(self):
@@ -37,71 +60,207 @@ class Mold:
         }
 
 
+class MoldCollection(dict):
+    """mold_id -> Mold dict that counts its modifications, so MoldDatabase knows when to rebuild its index"""
+    __slots__ = ('version',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self.version += 1
+        super().update(*args, **kwargs)
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def __reduce__(self):
+        # Rebuild from a plain dict, so unpickling does not call __setitem__ before version exists
+        return self.__class__, (dict(self),), (None, {'version': self.version})
+
+
 class MoldDatabase:
+    # Columns read from the source CSV and the types they are parsed as.
+    # Count is read as float64 so blank cells can be filled before it becomes int.
+    SOURCE_DTYPES = {
+        'Name': 'object',
+        'Type': 'object',
+        'Length (mm)': 'float64',
+        'Breadth (mm)': 'float64',
+        'Height (mm)': 'float64',
+        'Weight (kg)(With Powder)': 'float64',
+        'Oven Time': 'float64',
+        'Oven Temperature': 'float64',
+        'Cooling Time': 'float64',
+        'Molding/Demolding Time': 'float64',
+        'Count': 'float64'
+    }
+    # Values used for blank cells in the source CSV
+    DEFAULTS = {
+        'Type': 'UNKNOWN',
+        'Length (mm)': 500.0,
+        'Breadth (mm)': 500.0,
+        'Height (mm)': 500.0,
+        'Weight (kg)(With Powder)': 5.0,
+        'Oven Time': 3.0,
+        'Oven Temperature': 200.0,
+        'Cooling Time': 2.0,
+        'Molding/Demolding Time': 1.0,
+        'Count': 1
+    }
     def __init__(self, csv_file='molds.csv'):
         self.csv_file = csv_file
         self.molds = {}
         self.load_data()
 
+    @property
+    def molds(self):
+        return self._molds
+
+    @molds.setter
+    def molds(self, molds):
+        self._molds = MoldCollection(molds)
+        self._indexed_version = None
+
+    def _build_index(self):
+        # Parallel arrays over self.molds in insertion order, rebuilt whenever the collection changes.
+        # Mold parameters are treated as fixed once a mold is added.
+        self._mold_list = list(self._molds.values())
+        self._mold_ids = np.fromiter((mold.mold_id for mold in self._mold_list), dtype=object,
+                                     count=len(self._mold_list))
+        self._temps = np.array([mold.heating_temperature for mold in self._mold_list], dtype='float64')
+        self._times = np.array([mold.heating_time for mold in self._mold_list], dtype='float64')
+        # Row positions ordered by temperature, for binary searching a temperature window
+        self._temp_order = np.argsort(self._temps, kind='stable')
+        self._temps_sorted = self._temps[self._temp_order]
+        # Upper-cased type -> row positions, built once so lookups avoid a full scan
+        type_index = defaultdict(list)
+        for position, mold in enumerate(self._mold_list):
+            type_index[mold.mold_type.upper()].append(position)
+        self._type_index = {type_key: np.array(rows) for type_key, rows in type_index.items()}
+        self._indexed_version = self._molds.version
+
+    def _ensure_index(self):
+        if self._indexed_version != self._molds.version:
+            self._build_index()
+
     def load_data(self):
         try:
-            df = pd.read_csv(self.csv_file)
+            df = pd.read_csv(self.csv_file, usecols=list(self.SOURCE_DTYPES), dtype=self.SOURCE_DTYPES,
+                             engine=self._csv_engine())
             df = df.dropna(subset=['Name'])
-            for _, row in df.iterrows():
-                mold = self._create_mold_from_row(row)
-                self.molds[mold.mold_id] = mold
+            # Fill column by column; a frame-wide fillna(dict) costs more than the whole parse here
+            filled = {column: df[column].fillna(value) for column, value in self.DEFAULTS.items()}
+            volume = (filled['Length (mm)'] / 1000) * (filled['Breadth (mm)'] / 1000) * (filled['Height (mm)'] / 1000)
+            rows = zip(
+                df['Name'].astype(str).tolist(),
+                volume.tolist(),
+                filled['Weight (kg)(With Powder)'].tolist(),
+                filled['Oven Time'].tolist(),
+                filled['Oven Temperature'].tolist(),
+                filled['Cooling Time'].tolist(),
+                filled['Molding/Demolding Time'].tolist(),
+                filled['Count'].astype('int64').tolist(),
+                filled['Type'].astype(str).tolist()
+            )
+            molds = self.molds
+            for name, vol, weight, oven_time, oven_temp, cooling, mounting, count, mold_type in rows:
+                molds[name] = Mold(
+                    mold_id=name,
+                    volume=vol,
+                    weight=weight,
+                    heating_time=oven_time,
+                    heating_temperature=oven_temp,
+                    cooling_time=cooling,
+                    mounting_time=mounting,
+                    distance_from_center=0.5,
+                    available_quantity=count,
+                    mold_type=mold_type
+                )
         except Exception as e:
             print(f"Error loading data: {e}")
 
-    def _create_mold_from_row(self, row):
-        length = float(row['Length (mm)']) / 1000 if pd.notna(row['Length (mm)']) else 0.5
-        breadth = float(row['Breadth (mm)']) / 1000 if pd.notna(row['Breadth (mm)']) else 0.5
-        height = float(row['Height (mm)']) / 1000 if pd.notna(row['Height (mm)']) else 0.5
-        volume = length * breadth * height
-        mold_type = str(row['Type']) if pd.notna(row['Type']) else 'UNKNOWN'
-        return Mold(
-            mold_id=str(row['Name']),
-            volume=volume,
-            weight=float(row['Weight (kg)(With Powder)']) if pd.notna(row['Weight (kg)(With Powder)']) else 5.0,
-            heating_time=float(row['Oven Time']) if pd.notna(row['Oven Time']) else 3.0,
-            heating_temperature=float(row['Oven Temperature']) if pd.notna(row['Oven Temperature']) else 200.0,
-            cooling_time=float(row['Cooling Time']) if pd.notna(row['Cooling Time']) else 2.0,
-            mounting_time=float(row['Molding/Demolding Time']) if pd.notna(row['Molding/Demolding Time']) else 1.0,
-            distance_from_center=0.5,
-            available_quantity=int(row['Count']) if pd.notna(row['Count']) else 1,
-            mold_type=mold_type
-        )
+    def _csv_engine(self):
+        try:
+            large = os.path.getsize(self.csv_file) >= ARROW_MIN_BYTES
+        except (OSError, TypeError):
+            large = False
+        return CSV_ENGINE if large else 'c'
 
     def get_mold(self, mold_id):
         return self.molds.get(mold_id)
 
     def get_molds_by_type(self, mold_type):
-        return [mold for mold in self.molds.values() if mold_type.upper() in mold.mold_type.upper()]
+        self._ensure_index()
+        # Only a handful of distinct types, so scan the index keys rather than every mold
+        mold_type = mold_type.upper()
+        hits = [rows for type_key, rows in self._type_index.items() if mold_type in type_key]
+        if not hits:
+            return []
+        rows = hits[0] if len(hits) == 1 else np.sort(np.concatenate(hits))
+        mold_list = self._mold_list
+        return [mold_list[row] for row in rows]
 
     def get_compatible_molds(self, reference_mold, tolerance=0.02):
-        compatible = []
-        for mold in self.molds.values():
-            if mold.mold_id != reference_mold.mold_id:
-                if reference_mold.check_compatibility_with(mold, tolerance, tolerance):
-                    compatible.append(mold)
-        return compatible
+        self._ensure_index()
+        ref_temp = reference_mold.heating_temperature
+        if ref_temp > 0 and tolerance >= 0:
+            # Shortlist molds inside the temperature window (padded slightly for rounding),
+            # then apply the exact tolerance test to that shortlist only
+            slack = ref_temp * (tolerance + 1e-9)
+            start = np.searchsorted(self._temps_sorted, ref_temp - slack, side='left')
+            stop = np.searchsorted(self._temps_sorted, ref_temp + slack, side='right')
+            rows = np.sort(self._temp_order[start:stop])
+        else:
+            # No window to search (e.g. a zero or negative reference temperature), check every mold
+            rows = np.arange(len(self._mold_list))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            temp_diff = np.abs(self._temps[rows] - ref_temp) / ref_temp
+            time_diff = np.abs(self._times[rows] - reference_mold.heating_time) / reference_mold.heating_time
+        mask = (temp_diff <= tolerance) & (time_diff <= tolerance) & (self._mold_ids[rows] != reference_mold.mold_id)
+        mold_list = self._mold_list
+        return [mold_list[row] for row in rows[mask]]
 
     def update_availability(self, mold_id, quantity_used):
         if mold_id in self.molds:
             self.molds[mold_id].available_quantity -= quantity_used
 
     def save_to_csv(self, filename='updated_molds.csv'):
-        data = []
-        for mold in self.molds.values():
-            data.append({
-                'Name': mold.mold_id,
-                'Type': mold.mold_type,
-                'Count': mold.available_quantity,
-                'Weight (kg)(With Powder)': mold.weight,
-                'Oven Time': mold.heating_time,
-                'Oven Temperature': mold.heating_temperature,
-                'Cooling Time': mold.cooling_time,
-                'Molding/Demolding Time': mold.mounting_time
-            })
-        df = pd.DataFrame(data)
-        df.to_csv(filename, index=False)
\ No newline at end of file
+        molds = list(self.molds.values())
+        df = pd.DataFrame({
+            'Name': [mold.mold_id for mold in molds],
+            'Type': [mold.mold_type for mold in molds],
+            'Count': [mold.available_quantity for mold in molds],
+            'Weight (kg)(With Powder)': [mold.weight for mold in molds],
+            'Oven Time': [mold.heating_time for mold in molds],
+            'Oven Temperature': [mold.heating_temperature for mold in molds],
+            'Cooling Time': [mold.cooling_time for mold in molds],
+            'Molding/Demolding Time': [mold.mounting_time for mold in molds]
+        })
+        df.to_csv(filename, index=False)
@@ -1,5 +1,28 @@
+import math
+from fractions import Fraction
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit when numba is not installed: leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Default tolerances shared by the standalone checks and Arm.validate
+BALANCE_TOLERANCE = 0.1  # largest net torque an arm may carry
+COMPATIBILITY_TOLERANCE = 0.02  # largest relative spread of heating temperatures/times
+
+
 # 1. Mold Class
 class Mold:
+    __slots__ = ('mold_id', 'volume', 'weight', 'heating_time', 'heating_temperature', 'cooling_time',
+                 'mounting_time', 'distance_from_center', 'available_quantity', 'torque', 'cycle_time',
+                 '_inv_temp', '_inv_time')
+
     def __init__(self, mold_id, volume, weight, heating_time, heating_temperature, cooling_time,
                  mounting_time, distance_from_center, available_quantity):
         self.mold_id = mold_id
@@ -11,16 +34,22 @@ class Mold:
         self.mounting_time = mounting_time
         self.distance_from_center = distance_from_center
         self.available_quantity = available_quantity
+        # Inputs are fixed for the mold's lifetime, so compute these once
+        self.torque = weight * distance_from_center
+        self.cycle_time = heating_time + cooling_time + mounting_time
+        # Reciprocals for check_compatibility_with; a zero reference is never compatible
+        self._inv_temp = 1.0 / heating_temperature if heating_temperature else float('inf')
+        self._inv_time = 1.0 / heating_time if heating_time else float('inf')
 
     # 1.1
     def calculate_torque(self):
         """Returns torque (Nm) = weight * distance_from_center"""
-        return self.weight * self.distance_from_center
+        return self.torque
 
     # 1.2
     def get_cycle_time(self):
         """Returns total cycle time for one mold (sum of heating, cooling, mounting times)"""
-        return self.heating_time + self.cooling_time + self.mounting_time
+        return self.cycle_time
 
     # 1.3
     def check_availability(self, required_quantity):
@@ -28,10 +57,11 @@ class Mold:
         return required_quantity <= self.available_quantity
 
     # 1.4
-    def check_compatibility_with(self, other_mold, temp_tolerance=0.02, time_tolerance=0.02):
+    def check_compatibility_with(self, other_mold, temp_tolerance=COMPATIBILITY_TOLERANCE,
+                                 time_tolerance=COMPATIBILITY_TOLERANCE):
         """Returns True if other_mold is compatible on the same arm"""
-        temp_diff = abs(self.heating_temperature - other_mold.heating_temperature) / self.heating_temperature
-        time_diff = abs(self.heating_time - other_mold.heating_time) / self.heating_time
+        temp_diff = abs(self.heating_temperature - other_mold.heating_temperature) * self._inv_temp
+        time_diff = abs(self.heating_time - other_mold.heating_time) * self._inv_time
         return temp_diff <= temp_tolerance and time_diff <= time_tolerance
 
     # 1.5
@@ -47,6 +77,8 @@ class Mold:
 
 # 2. Spider Class (Modified)
 class Spider:
+    __slots__ = ('spider_type', 'attachment_sites', 'volume', 'weight', 'attachment_distance')
+
     def __init__(self, spider_type, attachment_sites, volume, weight, attachment_distance):
         self.spider_type = spider_type        # e.g., '2-way', '4-way'
         self.attachment_sites = attachment_sites   # int: 8 or 16
@@ -76,7 +108,72 @@ class Spider:
 
 
 # 3. Arm Class
+class MoldList(list):
+    """List of mounted molds that counts its modifications, so Arm knows when to rebuild its mold buffer"""
+    __slots__ = ('version',)
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        self.version = 0
+
+    def __setitem__(self, index, value):
+        super().__setitem__(index, value)
+        self.version += 1
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.version += 1
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, count):
+        self.version += 1
+        return super().__imul__(count)
+
+    def append(self, mold):
+        super().append(mold)
+        self.version += 1
+
+    def extend(self, molds):
+        super().extend(molds)
+        self.version += 1
+
+    def insert(self, index, mold):
+        super().insert(index, mold)
+        self.version += 1
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def remove(self, mold):
+        super().remove(mold)
+        self.version += 1
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+    def sort(self, **kwargs):
+        super().sort(**kwargs)
+        self.version += 1
+
+    def reverse(self):
+        super().reverse()
+        self.version += 1
+
+    def __reduce__(self):
+        # Rebuild from a plain list, so unpickling does not call append before version exists
+        return self.__class__, (list(self),), (None, {'version': self.version})
+
+
 class Arm:
+    __slots__ = ('arm_id', 'mounting_spots', 'max_volume', 'weight_capacity', 'torque_left_side',
+                 'torque_right_side', '_current_molds', 'current_spiders', '_mold_data', '_n_molds',
+                 '_synced_version')
+
     def __init__(self, arm_id, mounting_spots, max_volume, weight_capacity, torque_left_side, torque_right_side):
         self.arm_id = arm_id
         self.mounting_spots = mounting_spots
@@ -84,18 +181,30 @@ class Arm:
         self.weight_capacity = weight_capacity
         self.torque_left_side = torque_left_side
         self.torque_right_side = torque_right_side
-        self.current_molds = []
         self.current_spiders = []
+        # Packed per-mold parameters (rows _TEMP, _TIME, _TORQUE, _VOLUME), first _n_molds columns in use
+        self._mold_data = np.empty((_MOLD_FIELDS, _INITIAL_CAPACITY))
+        self._n_molds = 0
+        self.current_molds = []
+
+    @property
+    def current_molds(self):
+        return self._current_molds
+
+    @current_molds.setter
+    def current_molds(self, molds):
+        self._current_molds = MoldList(molds)
+        self._synced_version = None
 
     # 3.1
     def check_spatial_constraint(self):
         """Checks if current molds and spiders fit within arm volume"""
-        total_volume = sum([mold.volume for mold in self.current_molds])
-        total_volume += sum([spider.volume for spider in self.current_spiders])
-        return total_volume <= self.max_volume
+        self._ensure_mold_arrays()
+        return _volume_fits(self._mold_data[_VOLUME, :self._n_molds], float(self._spider_volume()),
+                            float(self.max_volume))
 
     # 3.2
-    def check_balance_constraint(self, tolerance=0.1):
+    def check_balance_constraint(self, tolerance=BALANCE_TOLERANCE):
         """Checks if torque balance is within tolerance"""
         balance_torque = self.calculate_balance_torque()
         return abs(balance_torque) <= tolerance
@@ -103,10 +212,9 @@ class Arm:
     # 3.3
     def calculate_balance_torque(self):
         """Calculates net torque on the arm (positive = right side heavy)"""
-        net_torque = self.torque_right_side - self.torque_left_side
-        for mold in self.current_molds:
-            net_torque += mold.calculate_torque()
-        return net_torque
+        self._ensure_mold_arrays()
+        return _net_torque(self._mold_data[_TORQUE, :self._n_molds], float(self.torque_left_side),
+                           float(self.torque_right_side))
 
     # 3.4
     def add_balancing_weight(self, weight, position):
@@ -117,45 +225,161 @@ class Arm:
             self.torque_right_side += weight * 1.0
 
     # 3.5
-    def check_torque_balance(self, balancing_weights):
+    def check_torque_balance(self, balancing_weights, tolerance=BALANCE_TOLERANCE):
         """Checks torque balance with given balancing weights configuration"""
-        temp_left = self.torque_left_side
-        temp_right = self.torque_right_side
-        for weight in balancing_weights:
-            if weight.position == 'left':
-                temp_left += weight.weight
-            else:
-                temp_right += weight.weight
-        return abs(temp_right - temp_left) <= 0.1
+        # Single pass: left weights count negative, everything else counts toward the right
+        delta = sum(-weight.weight if weight.position == 'left' else weight.weight
+                    for weight in balancing_weights)
+        return abs(self.torque_right_side - self.torque_left_side + delta) <= tolerance
 
     # 3.6
-    def check_temperature_compatibility(self):
+    def check_temperature_compatibility(self, tolerance=COMPATIBILITY_TOLERANCE):
         """Verifies all molds have compatible heating temperatures"""
-        if len(self.current_molds) <= 1:
-            return True
-        base_temp = self.current_molds[0].heating_temperature
-        for mold in self.current_molds[1:]:
-            if not self.current_molds[0].check_compatibility_with(mold):
-                return False
-        return True
+        self._ensure_mold_arrays()
+        return _spread_within(self._mold_data[_TEMP, :self._n_molds], tolerance)
 
     # 3.7
-    def check_duration_compatibility(self):
+    def check_duration_compatibility(self, tolerance=COMPATIBILITY_TOLERANCE):
         """Verifies all molds have compatible heating durations"""
-        if len(self.current_molds) <= 1:
-            return True
-        for i in range(len(self.current_molds) - 1):
-            if not self.current_molds[i].check_compatibility_with(self.current_molds[i+1]):
-                return False
+        self._ensure_mold_arrays()
+        return _spread_within(self._mold_data[_TIME, :self._n_molds], tolerance)
+
+    # 3.8
+    def add_mold(self, mold):
+        """Mounts a mold on the arm"""
+        self._ensure_mold_arrays()
+        if self._n_molds == self._mold_data.shape[1]:
+            grown = np.empty((_MOLD_FIELDS, 2 * self._n_molds))
+            grown[:, :self._n_molds] = self._mold_data
+            self._mold_data = grown
+        self._mold_data[:, self._n_molds] = _mold_fields(mold)
+        self._n_molds += 1
+        self._current_molds.append(mold)
+        self._synced_version = self._current_molds.version
+
+    # 3.9
+    def remove_mold(self, mold):
+        """Removes a mounted mold from the arm"""
+        self._ensure_mold_arrays()
+        index = self._current_molds.index(mold)
+        del self._current_molds[index]
+        self._mold_data[:, index:self._n_molds - 1] = self._mold_data[:, index + 1:self._n_molds]
+        self._n_molds -= 1
+        self._synced_version = self._current_molds.version
+
+    # 3.10
+    def validate(self, balance_tolerance=BALANCE_TOLERANCE, compatibility_tolerance=COMPATIBILITY_TOLERANCE):
+        """Runs every arm check in one pass and returns an ARM_* status code"""
+        self._ensure_mold_arrays()
+        return _validate_arm(self._mold_data, self._n_molds, float(self._spider_volume()),
+                             float(self.max_volume), float(self.torque_left_side),
+                             float(self.torque_right_side), float(balance_tolerance),
+                             float(compatibility_tolerance))
+
+    def _spider_volume(self):
+        """Returns the combined volume of the mounted spiders"""
+        return sum(spider.volume for spider in self.current_spiders)
+
+    def _sync_mold_arrays(self):
+        """Rebuilds the packed mold buffer from current_molds"""
+        capacity = max(_INITIAL_CAPACITY, len(self.current_molds))
+        data = self._mold_data = np.empty((_MOLD_FIELDS, capacity))
+        for index, mold in enumerate(self.current_molds):
+            data[:, index] = _mold_fields(mold)
+        self._n_molds = len(self.current_molds)
+        self._synced_version = self._current_molds.version
+
+    def _ensure_mold_arrays(self):
+        """Resyncs the packed buffer if current_molds was changed without add_mold/remove_mold"""
+        if self._synced_version != self._current_molds.version:
+            self._sync_mold_arrays()
+
+
+# Rows of Arm._mold_data
+_TEMP, _TIME, _TORQUE, _VOLUME = range(4)
+_MOLD_FIELDS = 4
+_INITIAL_CAPACITY = 8  # columns allocated up front; add_mold doubles the buffer when full
+
+# Status codes returned by Arm.validate
+ARM_OK = 0
+ARM_SPATIAL = 1
+ARM_BALANCE = 2
+ARM_TEMPERATURE = 3
+ARM_DURATION = 4
+ARM_FAILURE_MESSAGES = {
+    ARM_SPATIAL: "Spatial constraint violated",
+    ARM_BALANCE: "Balance constraint violated",
+    ARM_TEMPERATURE: "Temperature compatibility failed",
+    ARM_DURATION: "Duration compatibility failed"
+}
+
+
+def _mold_fields(mold):
+    """Returns a mold's column for Arm._mold_data"""
+    return mold.heating_temperature, mold.heating_time, mold.torque, mold.volume
+
+
+@njit(cache=True)
+def _volume_fits(volumes, spider_volume, max_volume):
+    """Checks that the mold volumes plus spider_volume fit within max_volume"""
+    total_volume = 0.0
+    for volume in volumes:
+        total_volume += volume
+    return total_volume + spider_volume <= max_volume
+
+
+@njit(cache=True)
+def _net_torque(torques, torque_left, torque_right):
+    """Returns the net torque of both sides plus the mold torques (positive = right side heavy)"""
+    net_torque = torque_right - torque_left
+    for torque in torques:
+        net_torque += torque
+    return net_torque
+
+
+@njit(cache=True)
+def _spread_within(values, tolerance):
+    """Checks that every pair of values differs by at most tolerance, relative to the smallest"""
+    if values.size <= 1:
         return True
+    lowest = values.min()
+    if lowest == 0:
+        return False
+    return bool((values.max() - lowest) / lowest <= tolerance)
+
+
+@njit(cache=True)
+def _validate_arm(mold_data, n_molds, spider_volume, max_volume, torque_left, torque_right,
+                  balance_tolerance, compatibility_tolerance):
+    """Spatial, balance, temperature and duration checks for one arm's packed state"""
+    if not _volume_fits(mold_data[_VOLUME, :n_molds], spider_volume, max_volume):
+        return ARM_SPATIAL
+    if not abs(_net_torque(mold_data[_TORQUE, :n_molds], torque_left, torque_right)) <= balance_tolerance:
+        return ARM_BALANCE
+    if not _spread_within(mold_data[_TEMP, :n_molds], compatibility_tolerance):
+        return ARM_TEMPERATURE
+    if not _spread_within(mold_data[_TIME, :n_molds], compatibility_tolerance):
+        return ARM_DURATION
+    return ARM_OK
 
 
 # 4. BalancingWeight Class
 class BalancingWeight:
+    __slots__ = ('weight_options', 'position', 'weight', '_dp_options', '_dp_step', '_dp_units',
+                 '_dp_table', '_dp_choice')
+
+    WEIGHT_RESOLUTION = 1000  # weights and torques are read to 1/1000 kg, so the table step is never finer
+    MAX_TABLE_STEPS = 100_000  # beyond this many steps the table costs too much; use the greedy selection
+
     def __init__(self, weight_options, position):
-        self.weight_options = weight_options  # List of available weights in kg
+        self.weight_options = tuple(sorted(weight_options, reverse=True))  # Available weights in kg, largest first
         self.position = position  # 'left' or 'right'
         self.weight = 0  # Current weight applied
+        self._dp_options = None  # weight_options the table was built from
+        self._dp_step = None  # exact kg per table step: the gcd of the positive weight options
+        self._dp_units = ()  # each weight option measured in steps (0 if unusable)
+        self._dp_table = [0]  # _dp_table[v]: fewest weights summing to v steps
+        self._dp_choice = [None]  # _dp_choice[v]: index of the last weight option used to reach v steps
 
     # 4.1
     def apply_weight(self, weight_value):
@@ -173,32 +397,122 @@ class BalancingWeight:
     # 4.3
     def calculate_optimal_weights(self, target_torque, available_positions):
         """Returns optimal weight configuration to achieve target torque"""
+        target = self._to_steps(target_torque)
+        if target > self.MAX_TABLE_STEPS:
+            return self._greedy_weights(target_torque, available_positions)
+        self._build_weight_table(target)
+        # Largest reachable torque using at most one weight per position
+        max_count = len(available_positions)
+        table = self._dp_table
+        while target > 0 and table[target] > max_count:
+            target -= 1
+        weights = sorted(self._reconstruct_weights(target), reverse=True)
+        return [{'weight': weight, 'position': position}
+                for weight, position in zip(weights, available_positions)]
+
+    # 4.4
+    def minimize_weight_count(self, target_torque):
+        """Returns minimum number of weights needed for target torque"""
+        target = self._to_steps(target_torque)
+        if target > self.MAX_TABLE_STEPS:
+            return self._greedy_weight_count(target_torque)
+        self._build_weight_table(target)
+        table = self._dp_table
+        while target > 0 and table[target] == float('inf'):
+            target -= 1
+        return table[target]
+
+    def _to_steps(self, torque):
+        """Converts a torque into whole table steps, rounding down"""
+        self._prepare_weight_steps()
+        if self._dp_step is None:
+            return 0
+        return int(_exact(abs(torque), self.WEIGHT_RESOLUTION) // self._dp_step)
+
+    def _prepare_weight_steps(self):
+        """Derives the exact step size from weight_options and resets the table when the options change"""
+        options = self.weight_options
+        if options is self._dp_options:
+            return
+        exact = [_exact(weight, self.WEIGHT_RESOLUTION) for weight in options]
+        positive = [weight for weight in exact if weight > 0]
+        if positive:
+            denominator = math.lcm(*(weight.denominator for weight in positive))
+            numerators = [weight.numerator * (denominator // weight.denominator) for weight in positive]
+            self._dp_step = Fraction(math.gcd(*numerators), denominator)
+            self._dp_units = tuple(int(weight / self._dp_step) if weight > 0 else 0 for weight in exact)
+        else:
+            self._dp_step = None
+            self._dp_units = tuple(0 for _ in exact)
+        self._dp_options = options
+        self._dp_table = [0]
+        self._dp_choice = [None]
+
+    def _build_weight_table(self, target):
+        """Builds the coin-change table up to target steps, reusing it while weight_options are unchanged"""
+        if target < len(self._dp_table):
+            return
+        size = max(target + 1, min(2 * len(self._dp_table), self.MAX_TABLE_STEPS + 1))
+        table = [0] + [float('inf')] * (size - 1)
+        choice = [None] * size
+        for index, steps in enumerate(self._dp_units):
+            if steps <= 0:
+                continue
+            for v in range(steps, size):
+                count = table[v - steps] + 1
+                if count < table[v]:
+                    table[v] = count
+                    choice[v] = index
+        self._dp_table = table
+        self._dp_choice = choice
+
+    def _reconstruct_weights(self, target):
+        """Returns the weights making up target steps by following the choice chain"""
+        choice = self._dp_choice
+        options = self.weight_options
+        units = self._dp_units
+        weights = []
+        while target > 0:
+            index = choice[target]
+            weights.append(options[index])
+            target -= units[index]
+        return weights
+
+    def _greedy_weights(self, target_torque, available_positions):
+        """Largest-first selection of one weight per position, for targets too fine for the table"""
         optimal_config = []
         remaining_torque = abs(target_torque)
-        
         for position in available_positions:
-            for weight in sorted(self.weight_options, reverse=True):
-                if weight <= remaining_torque:
+            for weight in self.weight_options:
+                if 0 < weight <= remaining_torque:
                     optimal_config.append({'weight': weight, 'position': position})
                     remaining_torque -= weight
                     break
         return optimal_config
 
-    # 4.4
-    def minimize_weight_count(self, target_torque):
-        """Returns minimum number of weights needed for target torque"""
+    def _greedy_weight_count(self, target_torque):
+        """Largest-first weight count, for targets too fine for the table"""
         weights_needed = 0
         remaining_torque = abs(target_torque)
-        
-        for weight in sorted(self.weight_options, reverse=True):
+        for weight in self.weight_options:
+            if weight <= 0:
+                continue
             while weight <= remaining_torque:
                 remaining_torque -= weight
                 weights_needed += 1
         return weights_needed
 
 
+def _exact(value, max_denominator):
+    """Returns value as a Fraction of its decimal form (0.15 -> 3/20), rounded to 1/max_denominator at most"""
+    return Fraction(str(value)).limit_denominator(max_denominator)
+
+
 # 5. RTXMachine Class
 class RTXMachine:
+    __slots__ = ('machine_id', 'machine_count', 'arms_list', 'current_cycle', 'daily_cycles_completed',
+                 'max_daily_cycles')
+
     def __init__(self, machine_id, machine_count=1):
         self.machine_id = machine_id
         self.machine_count = machine_count
@@ -211,14 +525,9 @@ class RTXMachine:
     def validate_arrangement(self):
         """Validates current mold arrangement across all arms"""
         for arm in self.arms_list:
-            if not arm.check_spatial_constraint():
-                return False, f"Spatial constraint violated on arm {arm.arm_id}"
-            if not arm.check_balance_constraint():
-                return False, f"Balance constraint violated on arm {arm.arm_id}"
-            if not arm.check_temperature_compatibility():
-                return False, f"Temperature compatibility failed on arm {arm.arm_id}"
-            if not arm.check_duration_compatibility():
-                return False, f"Duration compatibility failed on arm {arm.arm_id}"
+            status = arm.validate()
+            if status != ARM_OK:
+                return False, f"{ARM_FAILURE_MESSAGES[status]} on arm {arm.arm_id}"
         return True, "All constraints satisfied"
 
     # 5.2
@@ -245,37 +554,36 @@ class RTXMachine:
 
 # 6. Order Class
 class Order:
+    __slots__ = ('order_id', 'mold_requirements', 'deadline', 'completion_status', 'is_complete', '_unmet')
+
     def __init__(self, order_id, mold_requirements, deadline):
         self.order_id = order_id
         self.mold_requirements = mold_requirements  # Dict: {mold_id: quantity}
         self.deadline = deadline
         self.completion_status = {}  # Track progress per mold type
         self.is_complete = False
+        # Number of requirements not yet fulfilled, kept current by update_progress
+        self._unmet = sum(1 for required in mold_requirements.values() if 0 < required)
 
     # 6.1
     def update_progress(self, mold_id, quantity_produced):
         """Updates production progress for specific mold type"""
-        if mold_id not in self.completion_status:
-            self.completion_status[mold_id] = 0
-        self.completion_status[mold_id] += quantity_produced
+        before = self.completion_status.get(mold_id, 0)
+        self.completion_status[mold_id] = before + quantity_produced
         
         # Check if this mold requirement is fulfilled
         if mold_id in self.mold_requirements:
             required = self.mold_requirements[mold_id]
             if self.completion_status[mold_id] >= required:
                 self.completion_status[mold_id] = required
+            after = self.completion_status[mold_id]
+            self._unmet += (after < required) - (before < required)
 
     # 6.2
     def check_completion(self):
         """Checks if entire order is completed"""
-        for mold_id, required_qty in self.mold_requirements.items():
-            completed_qty = self.completion_status.get(mold_id, 0)
-            if completed_qty < required_qty:
-                self.is_complete = False
-                return False
-        
-        self.is_complete = True
-        return True
+        self.is_complete = self._unmet == 0
+        return self.is_complete
 
 
 def main():
@@ -313,5 +621,16 @@ def main():
     print("Parameter range mold1:", mold1.get_parameter_range())
     print("Parameter range mold4:", mold4.get_parameter_range())
 
+    print("----- BalancingWeight Class Tests -----")
+    # Test minimize_weight_count on whole and float-valued weight options
+    print("Min weights [1, 3, 4] for 6:", BalancingWeight([1, 3, 4], 'left').minimize_weight_count(6))           # 3 + 3 = 2
+    print("Min weights [0.15] for 0.3:", BalancingWeight([0.15], 'left').minimize_weight_count(0.3))             # 0.15 + 0.15 = 2
+    print("Min weights [0.1 + 0.2, 1] for 1:", BalancingWeight([0.1 + 0.2, 1], 'left').minimize_weight_count(1))  # 1
+    print("Min weights [1, 0.333] for 500 (edge, greedy):", BalancingWeight([1, 0.333], 'left').minimize_weight_count(500))  # 500
+
+    # Test calculate_optimal_weights with one weight per position
+    print("Optimal weights [1, 3, 4] for 6:", BalancingWeight([1, 3, 4], 'right').calculate_optimal_weights(6, ['P1', 'P2', 'P3']))  # 3 at P1, 3 at P2
+    print("Optimal weights [0.34] for 0.3 (edge, none fit):", BalancingWeight([0.34], 'right').calculate_optimal_weights(0.3, ['P1']))  # []
+
 if __name__ == "__main__":
     main()
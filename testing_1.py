@@ -1,5 +1,3 @@
-import csv
-
 # Define the filename
 filename = 'spiders.csv'
 
@@ -35,10 +33,8 @@ row = [
     100
 ]
 
-# Write the CSV file
+# Write the CSV file (plain values with no commas or quotes, so no csv.writer needed)
 with open(filename, 'w', newline='') as csvfile:
-    writer = csv.writer(csvfile)
-    writer.writerow(headers)
-    writer.writerow(row)
+    csvfile.write(','.join(headers) + '\r\n' + ','.join(str(value) for value in row) + '\r\n')
 
 print(f"CSV file '{filename}' created successfully.")
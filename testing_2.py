@@ -1,6 +1,26 @@
+import contextlib
+import io
+import os
+import sys
+from collections import defaultdict
+
+import numpy as np
 import pandas as pd
 
+# Prefer the multithreaded Arrow CSV parser when pyarrow is installed
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = 'pyarrow'
+except ImportError:
+    CSV_ENGINE = 'c'
+# The Arrow parser costs a few ms to start, so smaller files stay on the C parser
+ARROW_MIN_BYTES = 1 << 20
+
 class Mold:
+    __slots__ = ('mold_id', 'volume', 'weight', 'heating_time', 'heating_temperature', 'cooling_time',
+                 'mounting_time', 'distance_from_center', 'available_quantity', 'mold_type',
+                 'torque', 'cycle_time', '_inv_temp', '_inv_time')
+
     def __init__(self, mold_id, volume, weight, heating_time, heating_temperature, cooling_time,
                  mounting_time, distance_from_center, available_quantity, mold_type='UNKNOWN'):
         self.mold_id = mold_id
@@ -13,19 +33,25 @@ class Mold:
         self.distance_from_center = distance_from_center
         self.available_quantity = available_quantity
         self.mold_type = mold_type
+        # Inputs are fixed for the mold's lifetime, so compute these once
+        self.torque = weight * distance_from_center
+        self.cycle_time = heating_time + cooling_time + mounting_time
+        # Reciprocals for check_compatibility_with; a zero reference is never compatible
+        self._inv_temp = 1.0 / heating_temperature if heating_temperature else float('inf')
+        self._inv_time = 1.0 / heating_time if heating_time else float('inf')
 
     def calculate_torque(self):
-        return self.weight * self.distance_from_center
+        return self.torque
 
     def get_cycle_time(self):
-        return self.heating_time + self.cooling_time + self.mounting_time
+        return self.cycle_time
 
     def check_availability(self, required_quantity):
         return required_quantity <= self.available_quantity
 
     def check_compatibility_with(self, other_mold, temp_tolerance=0.02, time_tolerance=0.02):
-        temp_diff = abs(self.heating_temperature - other_mold.heating_temperature) / self.heating_temperature
-        time_diff = abs(self.heating_time - other_mold.heating_time) / self.heating_time
+        temp_diff = abs(self.heating_temperature - other_mold.heating_temperature) * self._inv_temp
+        time_diff = abs(self.heating_time - other_mold.heating_time) * self._inv_time
         return temp_diff <= temp_tolerance and time_diff <= time_tolerance
 
     def get_parameter_range(self):
@@ -37,199 +63,343 @@ class Mold:
         }
 
 
+class MoldCollection(dict):
+    """mold_id -> Mold dict that counts its modifications, so MoldDatabase knows when to rebuild its index"""
+    __slots__ = ('version',)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.version += 1
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.version += 1
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def pop(self, *args):
+        self.version += 1
+        return super().pop(*args)
+
+    def popitem(self):
+        self.version += 1
+        return super().popitem()
+
+    def setdefault(self, key, default=None):
+        self.version += 1
+        return super().setdefault(key, default)
+
+    def update(self, *args, **kwargs):
+        self.version += 1
+        super().update(*args, **kwargs)
+
+    def clear(self):
+        self.version += 1
+        super().clear()
+
+    def __reduce__(self):
+        # Rebuild from a plain dict, so unpickling does not call __setitem__ before version exists
+        return self.__class__, (dict(self),), (None, {'version': self.version})
+
+
 class MoldDatabase:
+    # Columns read from the source CSV and the types they are parsed as.
+    # Count is read as float64 so blank cells can be filled before it becomes int.
+    SOURCE_DTYPES = {
+        'Name': 'object',
+        'Type': 'object',
+        'Length (mm)': 'float64',
+        'Breadth (mm)': 'float64',
+        'Height (mm)': 'float64',
+        'Weight (kg)(With Powder)': 'float64',
+        'Oven Time': 'float64',
+        'Oven Temperature': 'float64',
+        'Cooling Time': 'float64',
+        'Molding/Demolding Time': 'float64',
+        'Count': 'float64'
+    }
+    # Values used for blank cells in the source CSV
+    DEFAULTS = {
+        'Type': 'UNKNOWN',
+        'Length (mm)': 500.0,
+        'Breadth (mm)': 500.0,
+        'Height (mm)': 500.0,
+        'Weight (kg)(With Powder)': 5.0,
+        'Oven Time': 3.0,
+        'Oven Temperature': 200.0,
+        'Cooling Time': 2.0,
+        'Molding/Demolding Time': 1.0,
+        'Count': 1
+    }
     def __init__(self, csv_file='molds.csv'):
         self.csv_file = csv_file
         self.molds = {}
         self.load_data()
 
+    @property
+    def molds(self):
+        return self._molds
+
+    @molds.setter
+    def molds(self, molds):
+        self._molds = MoldCollection(molds)
+        self._indexed_version = None
+
+    def _build_index(self):
+        # Parallel arrays over self.molds in insertion order, rebuilt whenever the collection changes.
+        # Mold parameters are treated as fixed once a mold is added.
+        self._mold_list = list(self._molds.values())
+        self._mold_ids = np.fromiter((mold.mold_id for mold in self._mold_list), dtype=object,
+                                     count=len(self._mold_list))
+        self._temps = np.array([mold.heating_temperature for mold in self._mold_list], dtype='float64')
+        self._times = np.array([mold.heating_time for mold in self._mold_list], dtype='float64')
+        # Row positions ordered by temperature, for binary searching a temperature window
+        self._temp_order = np.argsort(self._temps, kind='stable')
+        self._temps_sorted = self._temps[self._temp_order]
+        # Upper-cased type -> row positions, built once so lookups avoid a full scan
+        type_index = defaultdict(list)
+        for position, mold in enumerate(self._mold_list):
+            type_index[mold.mold_type.upper()].append(position)
+        self._type_index = {type_key: np.array(rows) for type_key, rows in type_index.items()}
+        self._indexed_version = self._molds.version
+
+    def _ensure_index(self):
+        if self._indexed_version != self._molds.version:
+            self._build_index()
+
     def load_data(self):
         try:
-            df = pd.read_csv(self.csv_file)
+            df = pd.read_csv(self.csv_file, usecols=list(self.SOURCE_DTYPES), dtype=self.SOURCE_DTYPES,
+                             engine=self._csv_engine())
             df = df.dropna(subset=['Name'])
-            for _, row in df.iterrows():
-                mold = self._create_mold_from_row(row)
-                self.molds[mold.mold_id] = mold
+            # Fill column by column; a frame-wide fillna(dict) costs more than the whole parse here
+            filled = {column: df[column].fillna(value) for column, value in self.DEFAULTS.items()}
+            volume = (filled['Length (mm)'] / 1000) * (filled['Breadth (mm)'] / 1000) * (filled['Height (mm)'] / 1000)
+            rows = zip(
+                df['Name'].astype(str).tolist(),
+                volume.tolist(),
+                filled['Weight (kg)(With Powder)'].tolist(),
+                filled['Oven Time'].tolist(),
+                filled['Oven Temperature'].tolist(),
+                filled['Cooling Time'].tolist(),
+                filled['Molding/Demolding Time'].tolist(),
+                filled['Count'].astype('int64').tolist(),
+                filled['Type'].astype(str).tolist()
+            )
+            molds = self.molds
+            for name, vol, weight, oven_time, oven_temp, cooling, mounting, count, mold_type in rows:
+                molds[name] = Mold(
+                    mold_id=name,
+                    volume=vol,
+                    weight=weight,
+                    heating_time=oven_time,
+                    heating_temperature=oven_temp,
+                    cooling_time=cooling,
+                    mounting_time=mounting,
+                    distance_from_center=0.5,
+                    available_quantity=count,
+                    mold_type=mold_type
+                )
         except Exception as e:
             print(f"Error loading data: {e}")
 
-    def _create_mold_from_row(self, row):
-        length = float(row['Length (mm)']) / 1000 if pd.notna(row['Length (mm)']) else 0.5
-        breadth = float(row['Breadth (mm)']) / 1000 if pd.notna(row['Breadth (mm)']) else 0.5
-        height = float(row['Height (mm)']) / 1000 if pd.notna(row['Height (mm)']) else 0.5
-        volume = length * breadth * height
-        mold_type = str(row['Type']) if pd.notna(row['Type']) else 'UNKNOWN'
-        return Mold(
-            mold_id=str(row['Name']),
-            volume=volume,
-            weight=float(row['Weight (kg)(With Powder)']) if pd.notna(row['Weight (kg)(With Powder)']) else 5.0,
-            heating_time=float(row['Oven Time']) if pd.notna(row['Oven Time']) else 3.0,
-            heating_temperature=float(row['Oven Temperature']) if pd.notna(row['Oven Temperature']) else 200.0,
-            cooling_time=float(row['Cooling Time']) if pd.notna(row['Cooling Time']) else 2.0,
-            mounting_time=float(row['Molding/Demolding Time']) if pd.notna(row['Molding/Demolding Time']) else 1.0,
-            distance_from_center=0.5,
-            available_quantity=int(row['Count']) if pd.notna(row['Count']) else 1,
-            mold_type=mold_type
-        )
+    def _csv_engine(self):
+        try:
+            large = os.path.getsize(self.csv_file) >= ARROW_MIN_BYTES
+        except (OSError, TypeError):
+            large = False
+        return CSV_ENGINE if large else 'c'
 
     def get_mold(self, mold_id):
         return self.molds.get(mold_id)
 
     def get_molds_by_type(self, mold_type):
-        return [mold for mold in self.molds.values() if mold_type.upper() in mold.mold_type.upper()]
+        self._ensure_index()
+        # Only a handful of distinct types, so scan the index keys rather than every mold
+        mold_type = mold_type.upper()
+        hits = [rows for type_key, rows in self._type_index.items() if mold_type in type_key]
+        if not hits:
+            return []
+        rows = hits[0] if len(hits) == 1 else np.sort(np.concatenate(hits))
+        mold_list = self._mold_list
+        return [mold_list[row] for row in rows]
 
     def get_compatible_molds(self, reference_mold, tolerance=0.02):
-        compatible = []
-        for mold in self.molds.values():
-            if mold.mold_id != reference_mold.mold_id:
-                if reference_mold.check_compatibility_with(mold, tolerance, tolerance):
-                    compatible.append(mold)
-        return compatible
+        self._ensure_index()
+        ref_temp = reference_mold.heating_temperature
+        if ref_temp > 0 and tolerance >= 0:
+            # Shortlist molds inside the temperature window (padded slightly for rounding),
+            # then apply the exact tolerance test to that shortlist only
+            slack = ref_temp * (tolerance + 1e-9)
+            start = np.searchsorted(self._temps_sorted, ref_temp - slack, side='left')
+            stop = np.searchsorted(self._temps_sorted, ref_temp + slack, side='right')
+            rows = np.sort(self._temp_order[start:stop])
+        else:
+            # No window to search (e.g. a zero or negative reference temperature), check every mold
+            rows = np.arange(len(self._mold_list))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            temp_diff = np.abs(self._temps[rows] - ref_temp) / ref_temp
+            time_diff = np.abs(self._times[rows] - reference_mold.heating_time) / reference_mold.heating_time
+        mask = (temp_diff <= tolerance) & (time_diff <= tolerance) & (self._mold_ids[rows] != reference_mold.mold_id)
+        mold_list = self._mold_list
+        return [mold_list[row] for row in rows[mask]]
 
     def update_availability(self, mold_id, quantity_used):
         if mold_id in self.molds:
             self.molds[mold_id].available_quantity -= quantity_used
 
     def save_to_csv(self, filename='updated_molds.csv'):
-        data = []
-        for mold in self.molds.values():
-            data.append({
-                'Name': mold.mold_id,
-                'Type': mold.mold_type,
-                'Count': mold.available_quantity,
-                'Weight (kg)(With Powder)': mold.weight,
-                'Oven Time': mold.heating_time,
-                'Oven Temperature': mold.heating_temperature,
-                'Cooling Time': mold.cooling_time,
-                'Molding/Demolding Time': mold.mounting_time
-            })
-        df = pd.DataFrame(data)
+        molds = list(self.molds.values())
+        df = pd.DataFrame({
+            'Name': [mold.mold_id for mold in molds],
+            'Type': [mold.mold_type for mold in molds],
+            'Count': [mold.available_quantity for mold in molds],
+            'Weight (kg)(With Powder)': [mold.weight for mold in molds],
+            'Oven Time': [mold.heating_time for mold in molds],
+            'Oven Temperature': [mold.heating_temperature for mold in molds],
+            'Cooling Time': [mold.cooling_time for mold in molds],
+            'Molding/Demolding Time': [mold.mounting_time for mold in molds]
+        })
         df.to_csv(filename, index=False)
 
 
 def main():
-    print("="*60)
-    print("TESTING MOLD CLASS AND MOLDDATABASE CLASS")
-    print("="*60)
+    # Collect the report and write it once instead of one print per line;
+    # the finally block still writes whatever was collected if a test raises
+    out = []
+    try:
+        out.append("="*60)
+        out.append("TESTING MOLD CLASS AND MOLDDATABASE CLASS")
+        out.append("="*60)
     
-    # Initialize database
-    db = MoldDatabase('molds.csv')
-    print(f"✓ Loaded {len(db.molds)} molds from CSV\n")
-
-    # Get test molds
-    mold1 = db.get_mold('CCIT 25')
-    mold2 = db.get_mold('CCIT 50')
-    mold3 = db.get_mold('CCIT 60')
-
-    if not all([mold1, mold2, mold3]):
-        print("❌ One or more test molds not found in database")
-        return
-
-    print("TESTING MOLD CLASS METHODS")
-    print("-" * 40)
+        # Initialize database, keeping anything load_data prints in report order
+        with contextlib.redirect_stdout(io.StringIO()) as load_output:
+            db = MoldDatabase('molds.csv')
+        out.extend(load_output.getvalue().splitlines())
+        out.append(f"✓ Loaded {len(db.molds)} molds from CSV\n")
+
+        # Get test molds
+        mold1 = db.get_mold('CCIT 25')
+        mold2 = db.get_mold('CCIT 50')
+        mold3 = db.get_mold('CCIT 60')
+
+        if not all([mold1, mold2, mold3]):
+            out.append("❌ One or more test molds not found in database")
+            return
+
+        out.append("TESTING MOLD CLASS METHODS")
+        out.append("-" * 40)
     
-    # Test 1: calculate_torque()
-    print("1. Testing calculate_torque():")
-    print(f"   {mold1.mold_id}: Weight={mold1.weight}kg × Distance={mold1.distance_from_center}m = {mold1.calculate_torque()} N⋅m")
-    print(f"   {mold2.mold_id}: Weight={mold2.weight}kg × Distance={mold2.distance_from_center}m = {mold2.calculate_torque()} N⋅m")
-    print(f"   {mold3.mold_id}: Weight={mold3.weight}kg × Distance={mold3.distance_from_center}m = {mold3.calculate_torque()} N⋅m\n")
-
-    # Test 2: get_cycle_time()
-    print("2. Testing get_cycle_time():")
-    print(f"   {mold1.mold_id}: {mold1.heating_time} + {mold1.cooling_time} + {mold1.mounting_time} = {mold1.get_cycle_time()} minutes")
-    print(f"   {mold2.mold_id}: {mold2.heating_time} + {mold2.cooling_time} + {mold2.mounting_time} = {mold2.get_cycle_time()} minutes")
-    print(f"   {mold3.mold_id}: {mold3.heating_time} + {mold3.cooling_time} + {mold3.mounting_time} = {mold3.get_cycle_time()} minutes\n")
-
-    # Test 3: check_availability()
-    print("3. Testing check_availability():")
-    for qty in [1, 2, 5]:
-        print(f"   {mold1.mold_id} (Available: {mold1.available_quantity}) - Need {qty}: {mold1.check_availability(qty)}")
-    for qty in [1, 2, 5]:
-        print(f"   {mold2.mold_id} (Available: {mold2.available_quantity}) - Need {qty}: {mold2.check_availability(qty)}")
-    print()
-
-    # Test 4: check_compatibility_with()
-    print("4. Testing check_compatibility_with():")
-    print(f"   {mold1.mold_id} vs {mold2.mold_id}: {mold1.check_compatibility_with(mold2)}")
-    print(f"   {mold1.mold_id} vs {mold3.mold_id}: {mold1.check_compatibility_with(mold3)}")
-    print(f"   {mold2.mold_id} vs {mold3.mold_id}: {mold2.check_compatibility_with(mold3)}")
+        # Test 1: calculate_torque()
+        out.append("1. Testing calculate_torque():")
+        out.append(f"   {mold1.mold_id}: Weight={mold1.weight}kg × Distance={mold1.distance_from_center}m = {mold1.calculate_torque()} N⋅m")
+        out.append(f"   {mold2.mold_id}: Weight={mold2.weight}kg × Distance={mold2.distance_from_center}m = {mold2.calculate_torque()} N⋅m")
+        out.append(f"   {mold3.mold_id}: Weight={mold3.weight}kg × Distance={mold3.distance_from_center}m = {mold3.calculate_torque()} N⋅m\n")
+
+        # Test 2: get_cycle_time()
+        out.append("2. Testing get_cycle_time():")
+        out.append(f"   {mold1.mold_id}: {mold1.heating_time} + {mold1.cooling_time} + {mold1.mounting_time} = {mold1.get_cycle_time()} minutes")
+        out.append(f"   {mold2.mold_id}: {mold2.heating_time} + {mold2.cooling_time} + {mold2.mounting_time} = {mold2.get_cycle_time()} minutes")
+        out.append(f"   {mold3.mold_id}: {mold3.heating_time} + {mold3.cooling_time} + {mold3.mounting_time} = {mold3.get_cycle_time()} minutes\n")
+
+        # Test 3: check_availability()
+        out.append("3. Testing check_availability():")
+        for qty in [1, 2, 5]:
+            out.append(f"   {mold1.mold_id} (Available: {mold1.available_quantity}) - Need {qty}: {mold1.check_availability(qty)}")
+        for qty in [1, 2, 5]:
+            out.append(f"   {mold2.mold_id} (Available: {mold2.available_quantity}) - Need {qty}: {mold2.check_availability(qty)}")
+        out.append("")
+
+        # Test 4: check_compatibility_with()
+        out.append("4. Testing check_compatibility_with():")
+        out.append(f"   {mold1.mold_id} vs {mold2.mold_id}: {mold1.check_compatibility_with(mold2)}")
+        out.append(f"   {mold1.mold_id} vs {mold3.mold_id}: {mold1.check_compatibility_with(mold3)}")
+        out.append(f"   {mold2.mold_id} vs {mold3.mold_id}: {mold2.check_compatibility_with(mold3)}")
     
-    # Test compatibility with different tolerances
-    print(f"   {mold1.mold_id} vs {mold2.mold_id} (10% tolerance): {mold1.check_compatibility_with(mold2, 0.1, 0.1)}")
-    print()
-
-    # Test 5: get_parameter_range()
-    print("5. Testing get_parameter_range():")
-    for mold in [mold1, mold2, mold3]:
-        params = mold.get_parameter_range()
-        print(f"   {mold.mold_id}: {params}")
-    print()
-
-    print("TESTING MOLDDATABASE CLASS METHODS")
-    print("-" * 40)
-
-    # Test 6: get_mold()
-    print("6. Testing get_mold():")
-    test_mold = db.get_mold('CCIT 125')
-    if test_mold:
-        print(f"   Found mold: {test_mold.mold_id}, Type: {test_mold.mold_type}")
-    else:
-        print("   Mold not found")
+        # Test compatibility with different tolerances
+        out.append(f"   {mold1.mold_id} vs {mold2.mold_id} (10% tolerance): {mold1.check_compatibility_with(mold2, 0.1, 0.1)}")
+        out.append("")
+
+        # Test 5: get_parameter_range()
+        out.append("5. Testing get_parameter_range():")
+        for mold in [mold1, mold2, mold3]:
+            params = mold.get_parameter_range()
+            out.append(f"   {mold.mold_id}: {params}")
+        out.append("")
+
+        out.append("TESTING MOLDDATABASE CLASS METHODS")
+        out.append("-" * 40)
+
+        # Test 6: get_mold()
+        out.append("6. Testing get_mold():")
+        test_mold = db.get_mold('CCIT 125')
+        if test_mold:
+            out.append(f"   Found mold: {test_mold.mold_id}, Type: {test_mold.mold_type}")
+        else:
+            out.append("   Mold not found")
     
-    non_existent = db.get_mold('NON_EXISTENT')
-    print(f"   Non-existent mold: {non_existent}")
-    print()
-
-    # Test 7: get_molds_by_type()
-    print("7. Testing get_molds_by_type():")
-    for mold_type in ['TUB', 'PLAIN LID', 'VENDING LID']:
-        molds = db.get_molds_by_type(mold_type)
-        print(f"   {mold_type} molds: {len(molds)}")
-        for mold in molds[:3]:  # Show first 3
-            print(f"     - {mold.mold_id}")
-        if len(molds) > 3:
-            print(f"     ... and {len(molds) - 3} more")
-    print()
-
-    # Test 8: get_compatible_molds()
-    print("8. Testing get_compatible_molds():")
-    reference_mold = db.get_mold('CCIT 50')
-    compatible_molds = db.get_compatible_molds(reference_mold, tolerance=0.05)
-    print(f"   Compatible molds with {reference_mold.mold_id} (5% tolerance): {len(compatible_molds)}")
-    for cmold in compatible_molds[:5]:  # Show first 5
-        print(f"     - {cmold.mold_id} (Temp: {cmold.heating_temperature}, Time: {cmold.heating_time})")
-    print()
-
-    # Test 9: update_availability()
-    print("9. Testing update_availability():")
-    test_mold_id = 'CCIT 60'
-    original_qty = db.get_mold(test_mold_id).available_quantity
-    print(f"   Original availability for {test_mold_id}: {original_qty}")
+        non_existent = db.get_mold('NON_EXISTENT')
+        out.append(f"   Non-existent mold: {non_existent}")
+        out.append("")
+
+        # Test 7: get_molds_by_type()
+        out.append("7. Testing get_molds_by_type():")
+        for mold_type in ['TUB', 'PLAIN LID', 'VENDING LID']:
+            molds = db.get_molds_by_type(mold_type)
+            out.append(f"   {mold_type} molds: {len(molds)}")
+            for mold in molds[:3]:  # Show first 3
+                out.append(f"     - {mold.mold_id}")
+            if len(molds) > 3:
+                out.append(f"     ... and {len(molds) - 3} more")
+        out.append("")
+
+        # Test 8: get_compatible_molds()
+        out.append("8. Testing get_compatible_molds():")
+        reference_mold = db.get_mold('CCIT 50')
+        compatible_molds = db.get_compatible_molds(reference_mold, tolerance=0.05)
+        out.append(f"   Compatible molds with {reference_mold.mold_id} (5% tolerance): {len(compatible_molds)}")
+        for cmold in compatible_molds[:5]:  # Show first 5
+            out.append(f"     - {cmold.mold_id} (Temp: {cmold.heating_temperature}, Time: {cmold.heating_time})")
+        out.append("")
+
+        # Test 9: update_availability()
+        out.append("9. Testing update_availability():")
+        test_mold_id = 'CCIT 60'
+        original_qty = db.get_mold(test_mold_id).available_quantity
+        out.append(f"   Original availability for {test_mold_id}: {original_qty}")
     
-    db.update_availability(test_mold_id, 1)
-    new_qty = db.get_mold(test_mold_id).available_quantity
-    print(f"   After using 1 unit: {new_qty}")
+        db.update_availability(test_mold_id, 1)
+        new_qty = db.get_mold(test_mold_id).available_quantity
+        out.append(f"   After using 1 unit: {new_qty}")
     
-    # Test updating non-existent mold
-    db.update_availability('NON_EXISTENT', 1)
-    print("   ✓ Handled non-existent mold gracefully")
-    print()
-
-    # Test 10: save_to_csv()
-    print("10. Testing save_to_csv():")
-    db.save_to_csv('test_output_molds.csv')
-    print("    ✓ Saved updated mold data to 'test_output_molds.csv'")
+        # Test updating non-existent mold
+        db.update_availability('NON_EXISTENT', 1)
+        out.append("   ✓ Handled non-existent mold gracefully")
+        out.append("")
+
+        # Test 10: save_to_csv()
+        out.append("10. Testing save_to_csv():")
+        db.save_to_csv('test_output_molds.csv')
+        out.append("    ✓ Saved updated mold data to 'test_output_molds.csv'")
     
-    # Verify the saved file
-    try:
-        saved_df = pd.read_csv('test_output_molds.csv')
-        print(f"    ✓ Verification: Saved file contains {len(saved_df)} rows")
-    except Exception as e:
-        print(f"    ❌ Error verifying saved file: {e}")
+        # Verify the saved file
+        try:
+            saved_df = pd.read_csv('test_output_molds.csv')
+            out.append(f"    ✓ Verification: Saved file contains {len(saved_df)} rows")
+        except Exception as e:
+            out.append(f"    ❌ Error verifying saved file: {e}")
     
-    print("\n" + "="*60)
-    print("ALL TESTS COMPLETED SUCCESSFULLY!")
-    print("="*60)
+        out.append("\n" + "="*60)
+        out.append("ALL TESTS COMPLETED SUCCESSFULLY!")
+        out.append("="*60)
+    finally:
+        sys.stdout.write("\n".join(out) + "\n")
 
 
 if __name__ == "__main__":